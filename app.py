@@ -10,11 +10,14 @@ from pathlib import Path
 
 import streamlit as st
 
-# Ensure the dev_docs package root is on sys.path so imports work
-PROJECT_ROOT = Path(__file__).resolve().parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
+# Ensure the dev_docs package root is on sys.path so imports work.
+# Streamlit re-executes this script on every rerun with an absolute __file__,
+# so skip .resolve() and only insert the path the first time.
+_ROOT = str(Path(__file__).parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from components.styles import inject_global_css
 from pages.endpoint_pages import build_endpoint_pages
 
 
@@ -25,11 +28,11 @@ def main() -> None:
         layout="wide",
     )
 
-    # Build per-endpoint pages (49 callable st.Page objects)
-    endpoint_page_list, endpoint_page_map = build_endpoint_pages()
+    # Shared styles for every page; the entrypoint runs once per rerun
+    inject_global_css()
 
-    # Store the map so other pages can use st.switch_page(page_object)
-    st.session_state["_endpoint_page_map"] = endpoint_page_map
+    # Build per-endpoint pages (49 callable st.Page objects)
+    endpoint_page_list = build_endpoint_pages()
 
     # Visible pages (shown in top navigation bar)
     visible_pages: dict[str, list[st.Page]] = {
@@ -2,47 +2,39 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-import streamlit as st
-
-from components.styles import method_badge_html
-
-
-def render_endpoint_card(endpoint: dict[str, Any], *, show_auth: bool = True) -> bool:
-    """Render a clickable endpoint card. Returns True if clicked."""
-    method = endpoint["method"]
-    path = endpoint["path"]
-    title = endpoint["title"]
-    summary = endpoint.get("summary", "")
-    auth = endpoint.get("auth", "")
-
-    badge = method_badge_html(method)
-    auth_html = (
-        f'<span class="auth-badge">{auth}</span>' if show_auth and auth else ""
-    )
-
-    html = f"""
-    <div class="endpoint-card">
-        <div style="display:flex; align-items:center; gap:10px; flex-wrap:wrap;">
-            {badge}
-            <span class="endpoint-path">{path}</span>
-            {auth_html}
-        </div>
-        <div style="margin-top:6px; font-size:0.92rem; font-weight:600; color:#0F172A;">
-            {title}
-        </div>
-        <div style="margin-top:2px; font-size:0.82rem; color:#64748B;">
-            {summary}
-        </div>
-    </div>
+from components.styles import auth_badge_html, method_badge_html
+from data.endpoints import Endpoint
+
+
+# Card markup, parsed once; filled per endpoint with ``str.format_map``
+_CARD_TEMPLATE = (
+    '<a href="/ep-{id}" target="_self" style="text-decoration:none;color:inherit;display:block;">'
+    '<div class="endpoint-card">'
+    '<div style="display:flex; align-items:center; gap:10px; flex-wrap:wrap;">'
+    '{badge} <span class="endpoint-path">{path}</span> {auth}'
+    "</div>"
+    '<div style="margin-top:6px; font-size:0.92rem; font-weight:600; color:#0F172A;">{title}</div>'
+    '<div style="margin-top:2px; font-size:0.82rem; color:#64748B;">{summary}</div>'
+    "</div>"
+    "</a>"
+)
+
+
+def endpoint_card_html(endpoint: Endpoint, *, show_auth: bool = True) -> str:
+    """Return HTML for an endpoint card that links to its detail page.
+
+    Navigation goes through the ``/ep-{id}`` URL of the endpoint's page, so
+    no button widget is needed per card. Callers join several cards and emit
+    them with a single ``st.html`` call.
     """
-    st.markdown(html, unsafe_allow_html=True)
-
-    # Use a small button as the clickable trigger (styled minimally)
-    return st.button(
-        f"View details",
-        key=f"card_{endpoint['id']}",
-        type="tertiary",
-        icon=":material/arrow_forward:",
+    auth = endpoint.auth_html
+    return _CARD_TEMPLATE.format_map(
+        {
+            "id": endpoint.id,
+            "badge": method_badge_html(endpoint.method),
+            "path": endpoint.path_html,
+            "auth": auth_badge_html(auth) if show_auth and auth else "",
+            "title": endpoint.title_html,
+            "summary": endpoint.summary_html,
+        }
     )
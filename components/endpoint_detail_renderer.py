@@ -2,93 +2,81 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 import streamlit as st
 
-from components.styles import inject_global_css, method_badge_html, status_code_html
-from data.endpoints import ENDPOINTS
+from components.styles import auth_badge_html, method_badge_html, status_code_html
+from data.endpoints import ENDPOINTS_BY_ID, ENDPOINTS_BY_TAG_SUB, Endpoint
 
 
-def render_endpoint_detail(ep: dict[str, Any]) -> None:
-    """Render the full documentation view for a single endpoint."""
-    inject_global_css()
+@st.cache_data(show_spinner=False)
+def _build_detail_html(ep_id: str) -> tuple[str, str, str]:
+    """Return the (header, meta, sections) HTML for an endpoint detail page.
 
-    # Back button
-    if st.button("Back to All Endpoints", icon=":material/arrow_back:", type="tertiary"):
-        st.switch_page("pages/all_endpoints.py")
+    All parts are pure functions of the static endpoint data, so they are
+    cached per endpoint id and reused on every later visit.
+    """
+    ep = ENDPOINTS_BY_ID[ep_id]
 
     # Header
-    badge = method_badge_html(ep["method"])
-    st.markdown(
+    badge = method_badge_html(ep.method)
+    header = (
         f'<div style="margin-top:8px;">{badge} '
-        f'<span class="endpoint-path" style="font-size:1.15rem;">{ep["path"]}</span></div>',
-        unsafe_allow_html=True,
+        f'<span class="endpoint-path" style="font-size:1.15rem;">{ep.path_html}</span></div>'
     )
-    st.markdown(f"## {ep['title']}")
 
     # Meta row
     meta_parts = []
-    if ep.get("auth"):
-        meta_parts.append(f'<span class="auth-badge">{ep["auth"]}</span>')
+    if ep.auth:
+        meta_parts.append(auth_badge_html(ep.auth_html))
     meta_parts.append(
         f'<span style="font-size:0.78rem;color:#64748B;">'
-        f'{ep.get("source_file", "")}:{ep.get("source_line", "")}</span>'
+        f"{ep.source_file}:{ep.source_line}</span>"
     )
-    st.markdown(
+    meta = (
         f'<div style="display:flex;gap:12px;align-items:center;flex-wrap:wrap;margin-bottom:8px;">'
         + " ".join(meta_parts)
-        + "</div>",
-        unsafe_allow_html=True,
+        + '</div><hr class="section-divider">'
     )
 
-    st.markdown("---")
-
-    # Description
-    desc = ep.get("description_long", ep.get("summary", ""))
-    if desc:
-        st.markdown("### Description")
-        st.markdown(desc)
+    parts: list[str] = []
 
     # Path parameters
-    path_params: list[tuple[str, str, str]] = ep.get("path_params", [])
+    path_params: list[tuple[str, str, str]] = ep.path_params_html
     if path_params:
-        st.markdown("### Path Parameters")
+        parts.append("<h3>Path Parameters</h3>")
         rows = "".join(
             f'<tr><td class="field-name">{name}</td>'
             f'<td class="field-type">{ftype}</td>'
             f"<td>{fdesc}</td></tr>"
             for name, ftype, fdesc in path_params
         )
-        st.markdown(
+        parts.append(
             f'<table class="schema-table"><thead><tr>'
             f"<th>Name</th><th>Type</th><th>Description</th>"
-            f"</tr></thead><tbody>{rows}</tbody></table>",
-            unsafe_allow_html=True,
+            f"</tr></thead><tbody>{rows}</tbody></table>"
         )
 
     # Query parameters
-    query_params: list[tuple[str, str, str]] = ep.get("query_params", [])
+    query_params: list[tuple[str, str, str]] = ep.query_params_html
     if query_params:
-        st.markdown("### Query Parameters")
+        parts.append("<h3>Query Parameters</h3>")
         rows = "".join(
             f'<tr><td class="field-name">{name}</td>'
             f'<td class="field-type">{ftype}</td>'
             f"<td>{fdesc}</td></tr>"
             for name, ftype, fdesc in query_params
         )
-        st.markdown(
+        parts.append(
             f'<table class="schema-table"><thead><tr>'
             f"<th>Name</th><th>Type</th><th>Description</th>"
-            f"</tr></thead><tbody>{rows}</tbody></table>",
-            unsafe_allow_html=True,
+            f"</tr></thead><tbody>{rows}</tbody></table>"
         )
 
     # Request body
-    request_body: list[tuple[str, ...]] = ep.get("request_body", [])
+    request_body: list[tuple[str, ...]] = ep.request_body_html
     if request_body:
-        st.markdown("### Request Body")
-        rows = ""
+        parts.append("<h3>Request Body</h3>")
+        row_parts: list[str] = []
         for item in request_body:
             if len(item) == 4:
                 name, ftype, required, fdesc = item
@@ -96,67 +84,88 @@ def render_endpoint_detail(ep: dict[str, Any]) -> None:
             else:
                 name, ftype, fdesc = item[0], item[1], item[-1]
                 req_text = "-"
-            rows += (
+            row_parts.append(
                 f'<tr><td class="field-name">{name}</td>'
                 f'<td class="field-type">{ftype}</td>'
                 f"<td>{req_text}</td>"
                 f"<td>{fdesc}</td></tr>"
             )
-        st.markdown(
+        rows = "".join(row_parts)
+        parts.append(
             f'<table class="schema-table"><thead><tr>'
             f"<th>Field</th><th>Type</th><th>Required</th><th>Description</th>"
-            f"</tr></thead><tbody>{rows}</tbody></table>",
-            unsafe_allow_html=True,
+            f"</tr></thead><tbody>{rows}</tbody></table>"
         )
 
     # Response
-    response_fields: list[tuple[str, str, str]] = ep.get("response_fields", [])
+    response_fields: list[tuple[str, str, str]] = ep.response_fields_html
     if response_fields:
-        resp_status = ep.get("response_status", 200)
-        st.markdown(f"### Response ({resp_status})")
+        resp_status = ep.response_status
+        parts.append(f"<h3>Response ({resp_status})</h3>")
         rows = "".join(
             f'<tr><td class="field-name">{name}</td>'
             f'<td class="field-type">{ftype}</td>'
             f"<td>{fdesc}</td></tr>"
             for name, ftype, fdesc in response_fields
         )
-        st.markdown(
+        parts.append(
             f'<table class="schema-table"><thead><tr>'
             f"<th>Field</th><th>Type</th><th>Description</th>"
-            f"</tr></thead><tbody>{rows}</tbody></table>",
-            unsafe_allow_html=True,
+            f"</tr></thead><tbody>{rows}</tbody></table>"
         )
 
     # Status codes
-    status_codes: dict[int, str] = ep.get("status_codes", {})
+    status_codes: list[tuple[int, str]] = ep.status_codes_html
     if status_codes:
-        st.markdown("### Status Codes")
+        parts.append("<h3>Status Codes</h3>")
         rows = "".join(
             f"<tr><td>{status_code_html(code)}</td><td>{fdesc}</td></tr>"
-            for code, fdesc in sorted(status_codes.items())
+            for code, fdesc in status_codes
         )
-        st.markdown(
+        parts.append(
             f'<table class="schema-table"><thead><tr>'
             f"<th>Code</th><th>Description</th>"
-            f"</tr></thead><tbody>{rows}</tbody></table>",
-            unsafe_allow_html=True,
+            f"</tr></thead><tbody>{rows}</tbody></table>"
         )
 
     # Related endpoints (for complex ones)
-    complexity = ep.get("complexity", "simple")
+    complexity = ep.complexity
     if complexity == "complex":
         related = [
             e
-            for e in ENDPOINTS
-            if e["tag"] == ep["tag"]
-            and e["subcategory"] == ep["subcategory"]
-            and e["id"] != ep["id"]
+            for e in ENDPOINTS_BY_TAG_SUB.get((ep.tag, ep.subcategory), [])
+            if e.id != ep.id
         ]
         if related:
-            st.markdown("### Related Endpoints")
-            for rel in related:
-                rel_badge = method_badge_html(rel["method"])
-                st.markdown(
-                    f'{rel_badge} `{rel["path"]}` — {rel["title"]}',
-                    unsafe_allow_html=True,
-                )
+            parts.append("<h3>Related Endpoints</h3>")
+            parts.extend(
+                f'<p>{method_badge_html(rel.method)} <code>{rel.path_html}</code> — {rel.title_html}</p>'
+                for rel in related
+            )
+
+    return header, meta, "".join(parts)
+
+
+def render_endpoint_detail(ep: Endpoint) -> None:
+    """Render the full documentation view for a single endpoint.
+
+    Only the back button is a widget. Pure-HTML sections come from the cached
+    markup and go through ``st.html``; ``st.markdown`` is kept for the title
+    and the markdown-formatted description.
+    """
+    # Back button
+    if st.button("Back to All Endpoints", icon=":material/arrow_back:", type="tertiary"):
+        st.switch_page("pages/all_endpoints.py")
+
+    header, meta, sections = _build_detail_html(ep.id)
+    st.html(header)
+    st.markdown(f"## {ep.title}")
+    st.html(meta)
+
+    # Description
+    desc = ep.description_long or ep.summary
+    if desc:
+        st.markdown(f"### Description\n\n{desc}")
+
+    if sections:
+        st.html(sections)
@@ -0,0 +1,93 @@
+"""Static step lists for the Processes page, rendered to HTML once at import.
+
+Page scripts are re-executed on every rerun, so the step cards are built
+here and the page only interpolates the finished strings.
+"""
+
+from __future__ import annotations
+
+
+def _step(number: int, text: str) -> str:
+    """Return HTML for a single process-step card."""
+    return (
+        f'<div class="process-step">'
+        f'<div class="process-step-number">{number}</div>'
+        f"<div>{text}</div>"
+        f"</div>"
+    )
+
+
+def _steps_html(items: list[str]) -> str:
+    """Return HTML for a sequence of process steps."""
+    return "".join(_step(i, t) for i, t in enumerate(items, 1))
+
+
+# Diarization pipeline
+DIARIZATION_STEPS_HTML = _steps_html(
+    [
+        "Audio file uploaded (<code>mp3</code> / <code>wav</code> only).",
+        "WhisperX model loaded (cached with <code>@lru_cache</code>, auto GPU / CPU detection).",
+        "WhisperX transcribes audio with <b>word-level timestamps</b>.",
+        "pyannote assigns speaker labels (<code>SPEAKER_00</code>, <code>SPEAKER_01</code>, ...).",
+        "Per-speaker audio extracted using <b>pydub</b> (group segments, slice, concatenate).",
+        "Each speaker's audio trimmed to a <b>10 s</b> preview and <b>base64-encoded</b> as WAV.",
+        "Diarized transcript JSON saved to <b>Firebase Storage</b>.",
+        "Meeting document updated with <code>transcript_storage_path</code>.",
+    ]
+)
+
+# Diarize-and-identify pipeline
+RECOGNITION_STEPS_HTML = _steps_html(
+    [
+        "Diarization runs (same pipeline as the Diarization tab).",
+        "Per-speaker audio segments extracted.",
+        "Audio normalized to <b>mono 16 kHz WAV</b> (<code>audio_preprocessing_service</code>).",
+        "SpeechBrain <b>ECAPA-VoxCeleb</b> encoder creates an embedding per speaker: audio chunked "
+        "(configurable chunk seconds), silent chunks filtered (RMS threshold), chunks encoded, "
+        "averaged, and <b>L2-normalized</b>.",
+        "Speaker embeddings JSON saved to <b>Firebase Storage</b>.",
+        "Participant embeddings loaded from Storage (uploaded earlier by the client admin).",
+        "Similarity matrix built: <code>(n_speakers x n_employees)</code>, cosine similarity via dot product.",
+        "<code>scipy.optimize.linear_sum_assignment</code> (<b>Hungarian algorithm</b>) finds optimal 1-to-1 matching.",
+        "Matches below the confidence threshold are marked <b>unmatched</b> (<code>employee_id = null</code>).",
+    ]
+)
+
+# Facilitator QR + PIN login
+FACILITATOR_LOGIN_STEPS_HTML = _steps_html(
+    [
+        "Client admin creates a team -- an <code>access_link_id</code> (UUID) is generated and "
+        "embedded into a <b>JWT</b> (HS256, <b>365-day</b> TTL).",
+        "A <b>QR code</b> is created encoding a URL that contains the JWT.",
+        "Facilitator scans the QR code and sends the JWT in the <code>X-Access-Token</code> header "
+        "along with their PIN in the request body.",
+        "Backend verifies the JWT, looks up the employee by PIN (<b>bcrypt</b>, 12 rounds).",
+        "A <b>session JWT</b> (24 h TTL) is issued containing <code>facilitator_id</code>, "
+        "<code>team_id</code>, <code>client_id</code>, and <code>access_link_id</code>.",
+        "Session token is used as the <code>X-Team-Session</code> header for all subsequent facilitator requests.",
+    ]
+)
+
+# Meeting analysis pipeline
+ANALYSIS_STEPS_HTML = _steps_html(
+    [
+        "Diarized transcript JSON files fetched from <b>Firebase Storage</b> "
+        "(<code>clients/{client_id}/teams/{team_id}/meetings/{meeting_id}/diarized_transcript*.json</code>).",
+        "Each JSON's segments parsed into <b>chat format</b>: <code>- Speaker Name: sentence</code>.",
+        "Multiple JSON files are sorted by name and concatenated.",
+        "Gemini runs <b>category analysis</b>: 8 team maturity categories scored 1 -- 4.",
+        "Gemini runs <b>competency analysis</b>: 3 most relevant facilitator competencies selected.",
+        "Results stored in the meeting document in Firestore.",
+    ]
+)
+
+# Access request workflow
+ACCESS_REQUEST_STEPS_HTML = _steps_html(
+    [
+        "IPM admin creates an access request for a target client.",
+        "Client admin reviews pending requests.",
+        "Client admin <b>accepts</b>, <b>declines</b>, or later <b>revokes</b> the request.",
+        "Once <b>ACCEPTED</b>, the IPM admin can access the client's data via "
+        "<code>require_ipm_admin_with_client_access</code>.",
+    ]
+)
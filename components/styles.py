@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 import streamlit as st
 
 # ---------------------------------------------------------------------------
@@ -16,7 +19,7 @@ METHOD_COLORS: dict[str, dict[str, str]] = {
 }
 
 # ---------------------------------------------------------------------------
-# Global CSS injected once per page
+# Global CSS injected once per script run (from app.py)
 # ---------------------------------------------------------------------------
 GLOBAL_CSS = """
 <style>
@@ -211,17 +214,40 @@ GLOBAL_CSS = """
 """
 
 
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a CSS/``<style>`` block."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+
+# Minified once at import; this is what is sent to the browser on every run
+_GLOBAL_CSS_MIN = _minify_css(GLOBAL_CSS)
+
+
 def inject_global_css() -> None:
-    """Inject the global CSS once into the current Streamlit page."""
-    st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
+    """Inject the global CSS into the current script run.
+
+    Called once from the ``app.py`` entrypoint, which Streamlit re-executes
+    before every page, so individual pages must not call it again.
+    """
+    st.markdown(_GLOBAL_CSS_MIN, unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=8)
 def method_badge_html(method: str) -> str:
     """Return an HTML span for an HTTP method badge."""
     css_class = f"method-{method.lower()}"
     return f'<span class="method-badge {css_class}">{method}</span>'
 
 
+@lru_cache(maxsize=16)
+def auth_badge_html(auth: str) -> str:
+    """Return an HTML span for an auth badge (*auth* must already be escaped)."""
+    return f'<span class="auth-badge">{auth}</span>'
+
+
+@lru_cache(maxsize=32)
 def status_code_html(code: int) -> str:
     """Return an HTML span for a status code badge."""
     if code < 300:
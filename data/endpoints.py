@@ -2,20 +2,61 @@
 
 from __future__ import annotations
 
-from typing import Any
+from html import escape
+from typing import Any, NamedTuple
+
+# ---------------------------------------------------------------------------
+# Endpoint record
+# ---------------------------------------------------------------------------
+
+class Endpoint(NamedTuple):
+    """Immutable, attribute-accessed record for a single API endpoint."""
+
+    id: str
+    method: str
+    path: str
+    tag: str
+    subcategory: str
+    title: str
+    summary: str
+    auth: str
+    complexity: str
+    source_file: str
+    source_line: int | str  # "" when the definition has no source location
+    description_long: str
+    request_body: list[tuple[Any, ...]]
+    response_fields: list[tuple[str, str, str]]
+    response_status: int
+    status_codes: dict[int, str]
+    path_params: list[tuple[str, str, str]]
+    query_params: list[tuple[str, str, str]]
+    # Pre-escaped HTML variants of the display fields
+    path_html: str
+    title_html: str
+    summary_html: str
+    auth_html: str
+    subcategory_html: str
+    request_body_html: list[tuple[Any, ...]]
+    response_fields_html: list[tuple[str, str, str]]
+    status_codes_html: list[tuple[int, str]]  # sorted by status code
+    path_params_html: list[tuple[str, str, str]]
+    query_params_html: list[tuple[str, str, str]]
+    # Lower-cased path/title/summary/description used by the search box
+    search_text: str
+
 
 # ---------------------------------------------------------------------------
 # Helper look-ups
 # ---------------------------------------------------------------------------
 
-def get_endpoint_by_id(endpoint_id: str) -> dict[str, Any] | None:
-    """Return the endpoint dict matching *endpoint_id*, or None."""
-    return _INDEX.get(endpoint_id)
+def get_endpoint_by_id(endpoint_id: str) -> Endpoint | None:
+    """Return the endpoint matching *endpoint_id*, or None."""
+    return ENDPOINTS_BY_ID.get(endpoint_id)
 
 
-def get_endpoints_by_tag(tag: str) -> list[dict[str, Any]]:
+def get_endpoints_by_tag(tag: str) -> list[Endpoint]:
     """Return all endpoints whose tag matches *tag*."""
-    return [e for e in ENDPOINTS if e["tag"] == tag]
+    return [e for e in ENDPOINTS if e.tag == tag]
 
 
 def get_all_tags() -> list[str]:
@@ -23,9 +64,9 @@ def get_all_tags() -> list[str]:
     seen: set[str] = set()
     result: list[str] = []
     for e in ENDPOINTS:
-        if e["tag"] not in seen:
-            seen.add(e["tag"])
-            result.append(e["tag"])
+        if e.tag not in seen:
+            seen.add(e.tag)
+            result.append(e.tag)
     return result
 
 
@@ -167,9 +208,9 @@ ACTOR_ENDPOINTS: dict[str, list[str]] = {
 }
 
 # ---------------------------------------------------------------------------
-# Complete endpoint registry
+# Complete endpoint registry (raw definitions, see ENDPOINTS below)
 # ---------------------------------------------------------------------------
-ENDPOINTS: list[dict[str, Any]] = [
+_ENDPOINT_DEFS: list[dict[str, Any]] = [
     # ======================================================================
     # IPM Admin Management
     # ======================================================================
@@ -1447,6 +1488,83 @@ ENDPOINTS: list[dict[str, Any]] = [
 
 
 # ---------------------------------------------------------------------------
-# Build index for O(1) look-up
+# Build Endpoint records, with HTML-escaped display fields computed once
 # ---------------------------------------------------------------------------
-_INDEX: dict[str, dict[str, Any]] = {e["id"]: e for e in ENDPOINTS}
+def _escape_rows(rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    """Return *rows* with every string cell HTML-escaped."""
+    return [tuple(escape(v, quote=False) if isinstance(v, str) else v for v in row) for row in rows]
+
+
+def _make_endpoint(d: dict[str, Any]) -> Endpoint:
+    """Build an :class:`Endpoint` from a raw definition dict.
+
+    Only ``id``, ``method``, ``path``, ``tag`` and ``title`` are required;
+    every other field falls back to its default, and unknown keys are ignored.
+    """
+    path = d["path"]
+    title = d["title"]
+    summary = d.get("summary", "")
+    auth = d.get("auth", "")
+    subcategory = d.get("subcategory", "General")
+    description_long = d.get("description_long", "")
+    request_body = d.get("request_body", [])
+    response_fields = d.get("response_fields", [])
+    status_codes = d.get("status_codes", {})
+    path_params = d.get("path_params", [])
+    query_params = d.get("query_params", [])
+    return Endpoint(
+        id=d["id"],
+        method=d["method"],
+        path=path,
+        tag=d["tag"],
+        subcategory=subcategory,
+        title=title,
+        summary=summary,
+        auth=auth,
+        complexity=d.get("complexity", "simple"),
+        source_file=d.get("source_file", ""),
+        source_line=d.get("source_line", ""),
+        description_long=description_long,
+        request_body=request_body,
+        response_fields=response_fields,
+        response_status=d.get("response_status", 200),
+        status_codes=status_codes,
+        path_params=path_params,
+        query_params=query_params,
+        path_html=escape(path, quote=False),
+        title_html=escape(title, quote=False),
+        summary_html=escape(summary, quote=False),
+        auth_html=escape(auth, quote=False),
+        subcategory_html=escape(subcategory, quote=False),
+        request_body_html=_escape_rows(request_body),
+        response_fields_html=_escape_rows(response_fields),
+        status_codes_html=[
+            (code, escape(desc, quote=False)) for code, desc in sorted(status_codes.items())
+        ],
+        path_params_html=_escape_rows(path_params),
+        query_params_html=_escape_rows(query_params),
+        search_text=f"{path} {title} {summary} {description_long}".lower(),
+    )
+
+
+ENDPOINTS: list[Endpoint] = [_make_endpoint(d) for d in _ENDPOINT_DEFS]
+
+# Pre-escaped (firestore_path, fields) per entity; ENTITY_FIELDS stays untouched
+ENTITY_FIELDS_HTML: dict[str, tuple[str, list[tuple[str, str, str]]]] = {
+    entity: (
+        escape(info.get("firestore_path", ""), quote=False),
+        _escape_rows(info.get("fields", [])),
+    )
+    for entity, info in ENTITY_FIELDS.items()
+}
+
+
+# ---------------------------------------------------------------------------
+# Build indexes for O(1) look-up
+# ---------------------------------------------------------------------------
+ENDPOINTS_BY_ID: dict[str, Endpoint] = {e.id: e for e in ENDPOINTS}
+
+ENDPOINTS_BY_TAG_SUB: dict[tuple[str, str], list[Endpoint]] = {}
+for _e in ENDPOINTS:
+    ENDPOINTS_BY_TAG_SUB.setdefault((_e.tag, _e.subcategory), []).append(_e)
+del _e
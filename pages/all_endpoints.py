@@ -2,32 +2,71 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import Counter
 
 import streamlit as st
 
-from components.styles import inject_global_css, method_badge_html
-from data.endpoints import ENDPOINTS, TAG_DISPLAY_NAMES, TAG_ORDER
+from components.endpoint_card import endpoint_card_html
+from components.styles import method_badge_html
+from data.endpoints import ENDPOINTS, ENDPOINTS_BY_ID, TAG_DISPLAY_NAMES, TAG_ORDER, Endpoint
 
+_TAG_ORDER_SET = frozenset(TAG_ORDER)
 
-def _get_subcategories(endpoints: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
-    """Group endpoints by subcategory, preserving insertion order."""
-    groups: dict[str, list[dict[str, Any]]] = {}
-    for ep in endpoints:
-        sub = ep.get("subcategory", "General")
-        groups.setdefault(sub, []).append(ep)
-    return groups
 
+@st.cache_data(show_spinner=False)
+def _method_counts() -> Counter[str]:
+    """Count endpoints per HTTP method (static, so computed once)."""
+    return Counter(ep.method for ep in ENDPOINTS)
 
-def _method_counts(endpoints: list[dict[str, Any]]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for ep in endpoints:
-        m = ep["method"]
-        counts[m] = counts.get(m, 0) + 1
-    return counts
 
+def _matches(ep: Endpoint, search_lower: str, method_filter: str) -> bool:
+    if method_filter != "All" and ep.method != method_filter:
+        return False
+    if search_lower:
+        return search_lower in ep.search_text
+    return True
+
+
+# Keyed on free-text search, so bound the cache to avoid unbounded growth
+@st.cache_data(show_spinner=False, max_entries=256)
+def _filter_and_group(search_lower: str, method_filter: str) -> dict[str, dict[str, list[str]]]:
+    """Return ``{tag: {subcategory: [endpoint ids]}}`` for matching endpoints.
+
+    Tags are in display order. Results are cached per (search, method) pair,
+    so reruns that do not change the filter skip the scan entirely.
+    """
+    filtered = [ep for ep in ENDPOINTS if _matches(ep, search_lower, method_filter)]
+
+    # Group by tag → subcategory in a single pass, preserving insertion order
+    grouped: dict[str, dict[str, list[str]]] = {}
+    for ep in filtered:
+        grouped.setdefault(ep.tag, {}).setdefault(ep.subcategory, []).append(ep.id)
+
+    # Tags in display order, then any tags not in TAG_ORDER (first-seen order)
+    present_tags = [tag for tag in TAG_ORDER if tag in grouped]
+    present_tags += [tag for tag in grouped if tag not in _TAG_ORDER_SET]
+
+    return {tag: grouped[tag] for tag in present_tags}
+
+
+def _tag_section_html(tag: str, subcategories: dict[str, list[str]]) -> str:
+    """Return the HTML for one tag section: header, subcategories and cards."""
+    display_name = TAG_DISPLAY_NAMES.get(tag, tag)
+    tag_count = sum(len(ids) for ids in subcategories.values())
+    parts: list[str] = [
+        f'<div class="tag-header">{display_name} '
+        f'<span style="font-size:0.8rem;font-weight:400;color:#64748B;">({tag_count} endpoints)</span>'
+        f"</div>"
+    ]
+
+    for ids in subcategories.values():
+        sub_eps = [ENDPOINTS_BY_ID[i] for i in ids]
+        parts.append(f'<div class="subcategory-header">{sub_eps[0].subcategory_html}</div>')
+        parts.extend(map(endpoint_card_html, sub_eps))
+
+    parts.append('<hr class="section-divider">')
+    return "".join(parts)
 
-inject_global_css()
 
 # ---------------------------------------------------------------------------
 # Page header
@@ -35,13 +74,13 @@ inject_global_css()
 st.title("All Endpoints")
 st.markdown(
     "Complete reference of every API endpoint, organised by category and sub-category. "
-    "Click **View details** on any endpoint to see its full documentation."
+    "Click any endpoint to see its full documentation."
 )
 
 # ---------------------------------------------------------------------------
 # Quick stats
 # ---------------------------------------------------------------------------
-counts = _method_counts(ENDPOINTS)
+counts = _method_counts()
 pills = "".join(
     f'<span class="stat-pill">'
     f'{method_badge_html(m)} {c}'
@@ -73,91 +112,22 @@ with col_method:
     )
 
 search_lower = search.strip().lower()
+grouped = _filter_and_group(search_lower, method_filter)
 
-
-def _matches(ep: dict[str, Any]) -> bool:
-    if method_filter != "All" and ep["method"] != method_filter:
-        return False
-    if search_lower:
-        haystack = f"{ep['path']} {ep['title']} {ep.get('summary', '')} {ep.get('description_long', '')}".lower()
-        return search_lower in haystack
-    return True
-
-
-filtered = [ep for ep in ENDPOINTS if _matches(ep)]
-
-if not filtered:
+if not grouped:
     st.info("No endpoints match your search.")
     st.stop()
 
 # ---------------------------------------------------------------------------
 # Render by tag → subcategory
 # ---------------------------------------------------------------------------
-# Determine which tags are present in filtered results
-present_tags = []
-for tag in TAG_ORDER:
-    if any(ep["tag"] == tag for ep in filtered):
-        present_tags.append(tag)
-# Include any tags not in TAG_ORDER
-for ep in filtered:
-    if ep["tag"] not in present_tags:
-        present_tags.append(ep["tag"])
-
-for tag in present_tags:
-    tag_endpoints = [ep for ep in filtered if ep["tag"] == tag]
-    if not tag_endpoints:
-        continue
-
-    display_name = TAG_DISPLAY_NAMES.get(tag, tag)
-    st.markdown(
-        f'<div class="tag-header">{display_name} '
-        f'<span style="font-size:0.8rem;font-weight:400;color:#64748B;">({len(tag_endpoints)} endpoints)</span>'
-        f"</div>",
-        unsafe_allow_html=True,
-    )
-
-    subcategories = _get_subcategories(tag_endpoints)
-
-    for sub_name, sub_eps in subcategories.items():
-        st.markdown(
-            f'<div class="subcategory-header">{sub_name}</div>',
-            unsafe_allow_html=True,
-        )
-
-        for ep in sub_eps:
-            badge = method_badge_html(ep["method"])
-            auth_html = (
-                f'<span class="auth-badge">{ep["auth"]}</span>'
-                if ep.get("auth")
-                else ""
-            )
-
-            st.markdown(
-                f"""<div class="endpoint-card">
-                    <div style="display:flex;align-items:center;gap:10px;flex-wrap:wrap;">
-                        {badge}
-                        <span class="endpoint-path">{ep["path"]}</span>
-                        {auth_html}
-                    </div>
-                    <div style="margin-top:6px;font-size:0.92rem;font-weight:600;color:#0F172A;">
-                        {ep["title"]}
-                    </div>
-                    <div style="margin-top:2px;font-size:0.82rem;color:#64748B;">
-                        {ep.get("summary", "")}
-                    </div>
-                </div>""",
-                unsafe_allow_html=True,
-            )
-
-            if st.button(
-                "View details",
-                key=f"all_{ep['id']}",
-                type="tertiary",
-                icon=":material/arrow_forward:",
-            ):
-                page_map = st.session_state.get("_endpoint_page_map", {})
-                target_page = page_map.get(ep["id"])
-                if target_page:
-                    st.switch_page(target_page)
-
-    st.markdown('<hr class="section-divider">', unsafe_allow_html=True)
+render_key = (search_lower, method_filter)
+if st.session_state.get("_ep_render_key") != render_key:
+    st.session_state["_ep_render_html"] = [
+        _tag_section_html(tag, subcategories) for tag, subcategories in grouped.items()
+    ]
+    st.session_state["_ep_render_key"] = render_key
+
+# One element per tag section instead of one per header/card group
+for section_html in st.session_state["_ep_render_html"]:
+    st.html(section_html)
@@ -8,33 +8,33 @@ from components.endpoint_detail_renderer import render_endpoint_detail
 from data.endpoints import ENDPOINTS, get_endpoint_by_id
 
 
-def _make_page_fn(endpoint_id: str):
-    """Return a closure that renders the detail page for a specific endpoint."""
+class _EndpointPage:
+    """Callable that renders the detail page for a specific endpoint.
 
-    def _page():
-        ep = get_endpoint_by_id(endpoint_id)
+    One shared ``__call__`` and a slotted id replace a closure per endpoint.
+    """
+
+    __slots__ = ("endpoint_id",)
+
+    def __init__(self, endpoint_id: str) -> None:
+        self.endpoint_id = endpoint_id
+
+    def __call__(self) -> None:
+        ep = get_endpoint_by_id(self.endpoint_id)
         if not ep:
             st.error("Endpoint not found.")
             st.stop()
         render_endpoint_detail(ep)
 
-    return _page
-
 
-def build_endpoint_pages() -> tuple[list[st.Page], dict[str, st.Page]]:
+def build_endpoint_pages() -> list[st.Page]:
     """Build st.Page objects for all endpoints.
 
-    Returns:
-        (pages_list, pages_by_id) — pages_by_id maps endpoint_id → st.Page
+    ``st.navigation`` and ``StreamlitPage.run`` keep per-run state on each
+    page object, so the pages are built fresh on every run rather than cached
+    and shared between sessions.
     """
-    pages: list[st.Page] = []
-    by_id: dict[str, st.Page] = {}
-    for ep in ENDPOINTS:
-        page = st.Page(
-            _make_page_fn(ep["id"]),
-            title=ep["title"],
-            url_path=f"ep-{ep['id']}",
-        )
-        pages.append(page)
-        by_id[ep["id"]] = page
-    return pages, by_id
+    return [
+        st.Page(_EndpointPage(ep.id), title=ep.title, url_path=f"ep-{ep.id}")
+        for ep in ENDPOINTS
+    ]
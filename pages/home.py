@@ -5,22 +5,19 @@ from __future__ import annotations
 import streamlit as st
 import streamlit.components.v1 as components
 
-from components.architecture_diagram import build_diagram_html
-from components.styles import inject_global_css
+from components.architecture_diagram import DIAGRAM_HEIGHT, build_diagram_html
+from data.endpoints import ENDPOINTS
 
-inject_global_css()
+_EP_COUNT = len(ENDPOINTS)
 
 st.title("IPM Partners Backend")
+
+# Intro, divider and legend in a single markdown element
 st.markdown(
     "Interactive architecture overview of the platform. "
     "**Hover** on any entity to see its endpoints or data fields. "
-    "**Click** an endpoint link to view its full documentation."
-)
-
-st.markdown("---")
-
-# Legend
-st.markdown(
+    "**Click** an endpoint link to view its full documentation.\n\n"
+    "---\n\n"
     '<div style="display:flex;gap:20px;margin-bottom:12px;flex-wrap:wrap;">'
     '<div style="display:flex;align-items:center;gap:6px;">'
     '<div style="width:16px;height:16px;border-radius:4px;background:linear-gradient(135deg,#2563EB,#1D4ED8);"></div>'
@@ -32,14 +29,12 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Render diagram
-diagram_html = build_diagram_html()
-components.html(diagram_html, height=620, scrolling=False)
-
-st.markdown("---")
+# Render diagram in its own iframe; the HTML is identical on every rerun
+components.html(build_diagram_html(), height=DIAGRAM_HEIGHT, scrolling=False)
 
-# Quick navigation cards
-st.markdown("### Quick Navigation")
+# Quick navigation: divider and heading in one element, then each card with
+# its button in the same column so they stay together when columns stack
+st.markdown("---\n\n### Quick Navigation")
 col1, col2, col3 = st.columns(3)
 
 with col1:
@@ -47,7 +42,7 @@ with col1:
         '<div style="background:#F1F5F9;border-radius:8px;padding:16px;">'
         '<div style="font-weight:600;font-size:1rem;color:#0F172A;">All Endpoints</div>'
         '<div style="font-size:0.82rem;color:#64748B;margin-top:4px;">'
-        "Browse all 48 endpoints organized by category and sub-category.</div></div>",
+        f"Browse all {_EP_COUNT} endpoints organized by category and sub-category.</div></div>",
         unsafe_allow_html=True,
     )
     if st.button("Browse endpoints", icon=":material/list_alt:", key="nav_ep"):